@@ -147,9 +147,12 @@ def cell(
 
     """
 
+    sig = default = default_args = None
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs) -> Component:
         nonlocal ports_not_manhattan, ports_offgrid, max_name_length
+        nonlocal sig, default, default_args
         from gdsfactory.pdk import get_active_pdk
 
         active_pdk = get_active_pdk()
@@ -169,7 +172,19 @@ def cell(
 
         prefix = prefix or func.__name__
 
-        sig = inspect.signature(func)
+        if default_args is None:
+            _sig = inspect.signature(func)
+            _default = {
+                p.name: p.default
+                for p in _sig.parameters.values()
+                if p.default != inspect._empty
+            }
+            # default args as strings, computed once per decorated function
+            _default_args = frozenset(
+                f"{key}={clean_value_name(value)}" for key, value in _default.items()
+            )
+            sig, default, default_args = _sig, _default, _default_args
+
         args_as_kwargs = dict(zip(sig.parameters.keys(), args))
         args_as_kwargs.update(kwargs)
 
@@ -180,25 +195,13 @@ def cell(
         if ports_not_manhattan is None:
             ports_not_manhattan = CONF.ports_not_manhattan
 
-        default = {
-            p.name: p.default
-            for p in sig.parameters.values()
-            if p.default != inspect._empty
-        }
-
         changed = args_as_kwargs
         full = default.copy()
         full.update(**args_as_kwargs)
-        default2 = default.copy()
-        changed2 = changed.copy()
 
-        # list of default args as strings
-        default_args_list = [
-            f"{key}={clean_value_name(default2[key])}" for key in sorted(default.keys())
-        ]
         # list of explicitly passed args as strings
         passed_args_list = [
-            f"{key}={clean_value_name(changed2[key])}" for key in sorted(changed.keys())
+            f"{key}={clean_value_name(changed[key])}" for key in sorted(changed.keys())
         ]
 
         if naming_style == "updk":
@@ -210,7 +213,7 @@ def cell(
             name = clean_name(name, allowed_characters=[":", ".", "="])
 
         elif naming_style == "default":
-            changed_arg_set = set(passed_args_list).difference(default_args_list)
+            changed_arg_set = set(passed_args_list).difference(default_args)
             changed_arg_list = sorted(changed_arg_set)
             named_args_string = "_".join(changed_arg_list)
 
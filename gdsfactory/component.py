@@ -961,7 +961,8 @@ class Component(_GeometryHelper):
         """
         from gdsfactory.pdk import get_cross_section, get_layer
 
-        layer = get_layer(layer)
+        if layer is not None:
+            layer = get_layer(layer)
 
         if port:
             if not isinstance(port, Port):
@@ -1494,11 +1495,11 @@ class Component(_GeometryHelper):
                     if component.function_name
                     else component.name
                 )
-                self._reference_names_counter.update({prefix: 1})
+                self._reference_names_counter[prefix] += 1
                 alias = f"{prefix}_{self._reference_names_counter[prefix]}"
 
                 while alias in self._named_references:
-                    self._reference_names_counter.update({prefix: 1})
+                    self._reference_names_counter[prefix] += 1
                     alias = f"{prefix}_{self._reference_names_counter[prefix]}"
 
         reference.name = alias
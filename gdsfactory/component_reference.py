@@ -780,12 +780,13 @@ class ComponentReference(_GeometryHelper):
         pdk = get_active_pdk()
 
         # port can either be a string with the name, port index, or an actual Port
-        if port in self.ports:
-            p = self.ports[port]
+        ports = self.ports
+        if port in ports:
+            p = ports[port]
         elif isinstance(port, Port):
             p = port
         else:
-            ports = list(self.ports.keys())
+            ports = list(ports.keys())
             raise ValueError(
                 f"port = {port!r} not in {self.parent.name!r} ports {ports}"
             )
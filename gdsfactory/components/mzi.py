@@ -53,7 +53,7 @@ def mzi(
         straight_x_bot: bottom straight for length_x.
         extend_ports_straight_x: optional extend ports for straight_x_bot/top.
         splitter: splitter function.
-        combiner: combiner function.
+        combiner: combiner function. None uses the splitter.
         with_splitter: if False removes splitter.
         port_e1_splitter: east top splitter port.
         port_e0_splitter: east bot splitter port.
@@ -85,8 +85,6 @@ def mzi(
                      b6__sxbot__b7
                           Lx
     """
-    combiner = combiner or splitter
-
     straight_x_top = straight_x_top or straight
     straight_x_bot = straight_x_bot or straight
     straight_y = straight_y or straight
@@ -105,9 +103,10 @@ def mzi(
         cp1 = c << cp1
 
     cp2 = c << cp2
+    cp1_ports = cp1.ports
     b5 = c << bend
     b5.mirror()
-    b5.connect("o1", cp1.ports[port_e0_splitter])
+    b5.connect("o1", cp1_ports[port_e0_splitter])
 
     straight_x_top = (
         gf.get_component(
@@ -148,7 +147,7 @@ def mzi(
     sxb.connect("o1", b6.ports["o2"])
 
     b1 = c << bend
-    b1.connect("o1", cp1.ports[port_e1_splitter])
+    b1.connect("o1", cp1_ports[port_e1_splitter])
 
     sytl = c << gf.get_component(
         straight_y, length=length_y, cross_section=cross_section
@@ -162,11 +161,13 @@ def mzi(
 
     cp2.mirror()
     xs = gf.get_cross_section(cross_section)
-    cp2.xmin = sxt.ports["o2"].x + bend.info["radius"] * nbends + 2 * xs.min_length
+    sxt_o2 = sxt.ports["o2"]
+    cp2.xmin = sxt_o2.x + bend.info["radius"] * nbends + 2 * xs.min_length
+    cp2_ports = cp2.ports
 
     route = get_route(
-        sxt.ports["o2"],
-        cp2.ports[port_e1_combiner],
+        sxt_o2,
+        cp2_ports[port_e1_combiner],
         straight=straight,
         bend=bend_spec,
         cross_section=cross_section,
@@ -175,7 +176,7 @@ def mzi(
     c.add(route.references)
     route = get_route(
         sxb.ports["o2"],
-        cp2.ports[port_e0_combiner],
+        cp2_ports[port_e0_combiner],
         straight=straight,
         bend=bend_spec,
         cross_section=cross_section,
@@ -187,7 +188,8 @@ def mzi(
     syl.name = "syl"
     sxt.name = "sxt"
     sxb.name = "sxb"
-    cp1.name = "cp1"
+    if with_splitter:
+        cp1.name = "cp1"
     cp2.name = "cp2"
 
     if with_splitter:
@@ -138,7 +138,8 @@ def mzm(
         syl.name = "syl"
         sxt.name = "sxt"
         sxb.name = "sxb"
-        cp1.name = "cp1"
+        if with_splitter:
+            cp1.name = "cp1"
         c.add_ports(cp2.get_ports_list(orientation=0), prefix="out_")
     else:
         c.add_port("o3", port=sxt["o2"])
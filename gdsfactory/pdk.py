@@ -411,12 +411,10 @@ class Pdk(BaseModel):
 
     def get_cell(self, cell: CellSpec, **kwargs) -> ComponentFactory:
         """Returns ComponentFactory from a cell spec."""
-        cells = set(self.cells.keys())
-
         if callable(cell):
             return cell
         elif isinstance(cell, str):
-            if cell not in cells:
+            if cell not in self.cells:
                 cells = list(self.cells.keys())
                 raise ValueError(
                     f"{cell!r} from PDK {self.name!r} not in cells: {cells} "
@@ -432,7 +430,7 @@ class Pdk(BaseModel):
             settings.update(**kwargs)
 
             cell_name = cell.get("function")
-            if not isinstance(cell_name, str) or cell_name not in cells:
+            if not isinstance(cell_name, str) or cell_name not in self.cells:
                 cells = list(self.cells.keys())
                 raise ValueError(
                     f"{cell_name!r} from PDK {self.name!r} not in cells: {cells} "
@@ -474,8 +472,6 @@ class Pdk(BaseModel):
             kwargs: settings to override component settings.
 
         """
-        cells = set(cells.keys())
-
         if isinstance(component, Component):
             if kwargs:
                 warnings.warn(
@@ -491,7 +487,7 @@ class Pdk(BaseModel):
         elif isinstance(component, str):
             if component not in cells:
                 raise ValueError(
-                    f"{component!r} not in PDK {self.name!r} cells: {cells} "
+                    f"{component!r} not in PDK {self.name!r} cells: {set(cells)} "
                 )
             return self.cells[component](**kwargs)
         elif isinstance(component, dict | DictConfig):
@@ -509,7 +505,7 @@ class Pdk(BaseModel):
 
             if not isinstance(cell_name, str) or cell_name not in cells:
                 raise ValueError(
-                    f"{cell_name!r} from PDK {self.name!r} not in cells: {cells} "
+                    f"{cell_name!r} from PDK {self.name!r} not in cells: {set(cells)} "
                 )
             cell = self.cells[cell_name]
             if validate:
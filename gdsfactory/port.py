@@ -555,33 +555,22 @@ def select_ports(
     if isinstance(ports, Component | ComponentReference):
         ports = ports.ports
 
-    if layer:
-        layer = get_layer(layer)
-        ports = {p_name: p for p_name, p in ports.items() if p.layer == layer}
-    if prefix:
-        ports = {
-            p_name: p for p_name, p in ports.items() if str(p_name).startswith(prefix)
-        }
-    if suffix:
-        ports = {
-            p_name: p for p_name, p in ports.items() if str(p_name).endswith(suffix)
-        }
-    if orientation is not None:
-        ports = {
-            p_name: p for p_name, p in ports.items() if p.orientation == orientation
-        }
-
+    layer = get_layer(layer) if layer else None
     if layers_excluded:
         layers_excluded = [get_layer(layer) for layer in layers_excluded]
-        ports = {
-            p_name: p for p_name, p in ports.items() if p.layer not in layers_excluded
-        }
-    if width:
-        ports = {p_name: p for p_name, p in ports.items() if p.width == width}
-    if port_type:
-        ports = {p_name: p for p_name, p in ports.items() if p.port_type == port_type}
-    if names:
-        ports = {p_name: p for p_name, p in ports.items() if p_name in names}
+
+    ports = {
+        p_name: p
+        for p_name, p in ports.items()
+        if (layer is None or p.layer == layer)
+        and (not prefix or str(p_name).startswith(prefix))
+        and (not suffix or str(p_name).endswith(suffix))
+        and (orientation is None or p.orientation == orientation)
+        and (not layers_excluded or p.layer not in layers_excluded)
+        and (not width or p.width == width)
+        and (not port_type or p.port_type == port_type)
+        and (not names or p_name in names)
+    }
 
     if clockwise:
         ports = sort_ports_clockwise(ports)
@@ -665,14 +654,12 @@ def _rename_ports_facing_side(
     """Renames ports clockwise."""
     for direction, list_ports in list(direction_ports.items()):
         if direction in ["E", "W"]:
-            # first sort along x then y
-            list_ports.sort(key=lambda p: p.x)
-            list_ports.sort(key=lambda p: p.y)
+            # sort along y, then x for ports at the same y
+            list_ports.sort(key=lambda p: (p.y, p.x))
 
         if direction in ["S", "N"]:
-            # first sort along y then x
-            list_ports.sort(key=lambda p: p.y)
-            list_ports.sort(key=lambda p: p.x)
+            # sort along x, then y for ports at the same x
+            list_ports.sort(key=lambda p: (p.x, p.y))
 
         for i, p in enumerate(list_ports):
             p.name = prefix + direction + str(i)
@@ -684,14 +671,12 @@ def _rename_ports_facing_side_ccw(
     """Renames ports counter-clockwise."""
     for direction, list_ports in list(direction_ports.items()):
         if direction in ["E", "W"]:
-            # first sort along x then y
-            list_ports.sort(key=lambda p: -p.x)
-            list_ports.sort(key=lambda p: -p.y)
+            # sort along y, then x for ports at the same y
+            list_ports.sort(key=lambda p: (-p.y, -p.x))
 
         if direction in ["S", "N"]:
-            # first sort along y then x
-            list_ports.sort(key=lambda p: -p.y)
-            list_ports.sort(key=lambda p: -p.x)
+            # sort along x, then y for ports at the same x
+            list_ports.sort(key=lambda p: (-p.x, -p.y))
 
         for i, p in enumerate(list_ports):
             p.name = prefix + direction + str(i)
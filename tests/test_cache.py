@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 import gdsfactory as gf
 
 _this_dir = Path(__file__).parent
@@ -32,3 +34,23 @@ def test_cache_name_yaml() -> None:
 
     assert c3.name == "test_pcell"
     assert c3 is c4
+
+
+def test_cache_mzi() -> None:
+    c1 = gf.components.mzi(delta_length=20)
+    c2 = gf.components.mzi(delta_length=20)
+    c3 = gf.components.mzi()
+
+    assert c1 is c2
+    assert c1.name == "mzi_delta_length20"
+    assert c3.name == "mzi"
+
+
+def test_cache_unserializable_default() -> None:
+    @gf.cell
+    def cell_with_lambda_default(function=lambda x: x) -> gf.Component:
+        return gf.Component()
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="lambda"):
+            cell_with_lambda_default()
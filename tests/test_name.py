@@ -62,6 +62,12 @@ def test_name_different_signatures():
     assert c1.name != c2.name, f"{c1.name!r} should differ from {c2.name!r}"
 
 
+def test_name_mzi_without_splitter() -> None:
+    splitter = gf.components.mmi1x2()
+    gf.components.mzi(with_splitter=False)
+    assert splitter.name == "mmi1x2", f"{splitter.name!r} should not be renamed"
+
+
 if __name__ == "__main__":
     # test_clean_name()
     # test_name_shortened()